@@ -6,7 +6,6 @@ MCP Agent - Fallback Mode (Works without OpenAI Agents SDK)
 import os
 import sys
 import time
-import requests
 from datetime import datetime
 
 def create_intelligent_content(task):
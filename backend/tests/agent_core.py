@@ -0,0 +1,163 @@
+"""
+Shared plumbing for the standalone MCP agent scripts
+"""
+
+import functools
+import os
+import re
+import sys
+import time
+
+# Resolved once per process; the agents never change directory
+WORKING_DIR = os.getcwd()
+SANDBOX_PATH = os.path.join(WORKING_DIR, "sandbox")
+
+_sandbox_ready = False
+
+_FIELD_RE = re.compile(rb"\{(\w+)\}")
+
+
+def get_task():
+    """Read the task from the command line, falling back to stdin"""
+    argv = sys.argv
+    if len(argv) == 2:
+        return argv[1]
+    if len(argv) > 2:
+        return " ".join(argv[1:])
+    if sys.stdin is None:
+        return ""
+    return sys.stdin.buffer.read().decode('utf-8', 'replace').strip()
+
+
+def ensure_sandbox():
+    """Create the sandbox directory (once per process) and return its path"""
+    global _sandbox_ready
+    if not _sandbox_ready:
+        # WORKING_DIR always exists, so one mkdir is enough
+        try:
+            os.mkdir(SANDBOX_PATH)
+        except FileExistsError:
+            pass
+        _sandbox_ready = True
+    return SANDBOX_PATH
+
+
+@functools.lru_cache(maxsize=None)
+def _template_fields(template):
+    """(start, end, name) of every {name} marker in a template"""
+    return tuple((m.start(), m.end(), m.group(1).decode())
+                 for m in _FIELD_RE.finditer(template))
+
+
+def render(template, **fields):
+    """Fill {name} markers in a pre-encoded template
+
+    Returns a tuple of byte chunks. The static text between markers is
+    served as memoryview slices of the template, so nothing is copied
+    before write_output hands the chunks to the kernel.
+    """
+    view = memoryview(template)
+    chunks = []
+    pos = 0
+    for start, end, name in _template_fields(template):
+        if name in fields:
+            chunks.append(view[pos:start])
+            chunks.append(str(fields[name]).encode('utf-8', 'replace'))
+            pos = end
+    chunks.append(view[pos:])
+    return tuple(chunks)
+
+
+def _write_chunks(fd, chunks):
+    """Write every chunk to fd, with a single writev where available"""
+    if hasattr(os, "writev"):
+        written = os.writev(fd, chunks)
+        if written == sum(len(chunk) for chunk in chunks):
+            return
+        data = b"".join(chunks)[written:]
+    else:
+        data = b"".join(chunks)
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def write_output(path, content):
+    """Write content to path in one system call
+
+    content is a str, bytes, or a sequence of byte chunks from render().
+    The data goes to a temporary file next to path which is then renamed
+    over it, so readers of the sandbox never see a half-written file.
+    """
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    chunks = (content,) if isinstance(content, bytes) else content
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            _write_chunks(fd, chunks)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def run(content_fn, banner=(), status=None, steps=3, step_label="Working",
+        done=(), default_task=None):
+    """Run an agent: read the task, build its output file and write it.
+
+    content_fn(task) returns a dict with "filename" and "content", where
+    content is anything write_output accepts. Status lines are collected
+    and written to stdout in one go when the run ends. Returns True if the
+    output file was created.
+    """
+    log = list(banner)
+    try:
+        # Read task from stdin or command line
+        try:
+            task = get_task()
+        except (OSError, ValueError) as e:
+            if default_task is None:
+                log.append(f"❌ Error reading task: {e}")
+                return False
+            task = default_task
+
+        if not task:
+            if default_task is None:
+                log.append("❌ No task provided")
+                return False
+            task = default_task
+
+        log.append(f"📋 Task: {task}")
+
+        # Create sandbox directory
+        sandbox = ensure_sandbox()
+        log.append(f"📁 Sandbox: {sandbox}")
+
+        # Simulate agent work
+        if status:
+            log.append(status)
+        log.extend(f"Step {i + 1}: {step_label}..." for i in range(steps))
+        time.sleep(float(os.environ.get("MCP_SIMULATE_DELAY", "0")))
+
+        # Generate content and write the output file
+        result = content_fn(task)
+        filename = result["filename"]
+        try:
+            write_output(f"{sandbox}/{filename}", result["content"])
+        except Exception as e:
+            log.append(f"❌ Error creating file: {e}")
+            return False
+
+        log.append(f"✅ Created file: {filename}")
+        log.extend(line.format(filename=filename) for line in done)
+        return True
+    finally:
+        if log:
+            sys.stdout.write("\n".join(log) + "\n")
+            sys.stdout.flush()
@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -BOO
 """
 Quick diagnostic script to test MCP agent
 """
@@ -7,42 +7,15 @@ import os
 import sys
 import time
 
-def main():
-    print("🔍 MCP Agent Diagnostic Test")
-    print("=" * 40)
-    
-    # Get task from stdin
-    try:
-        if len(sys.argv) > 1:
-            task = " ".join(sys.argv[1:])
-        else:
-            task = sys.stdin.read().strip()
-    except:
-        task = "test task"
-    
-    print(f"📋 Task: {task}")
-    
-    # Create sandbox directory
-    sandbox_path = os.path.join(os.getcwd(), "sandbox")
-    os.makedirs(sandbox_path, exist_ok=True)
-    print(f"📁 Sandbox: {sandbox_path}")
-    
-    # Simple mock execution
-    print("🧪 Running diagnostic test...")
-    
-    for i in range(3):
-        print(f"Step {i+1}: Processing...")
-        time.sleep(0.5)
-    
-    # Create a test file
-    filename = "diagnostic_test.md"
-    content = f"""# Diagnostic Test Results
+from agent_core import SANDBOX_PATH, WORKING_DIR, render, run
+
+_DIAGNOSTIC_TMPL = """# Diagnostic Test Results
 
 ## Test Information
 - Task: {task}
-- Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}
-- Working Directory: {os.getcwd()}
-- Sandbox Path: {sandbox_path}
+- Timestamp: {timestamp}
+- Working Directory: {cwd}
+- Sandbox Path: {sandbox}
 
 ## Status
 ✅ Python script executed successfully
@@ -52,32 +25,49 @@ def main():
 ## Next Steps
 If you see this file in your web interface, the basic functionality is working.
 The JSON parsing error is likely in the server communication, not the Python script.
-"""
-    
-    output_file = os.path.join(sandbox_path, filename)
-    
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"✅ Created file: {filename}")
-    except Exception as e:
-        print(f"❌ File creation failed: {e}")
-        return False
-    
-    print("🎉 Diagnostic test completed successfully!")
-    print(f"Final result: Diagnostic test passed - created {filename}")
-    return True
+""".encode('utf-8')
+
+
+def create_test_file(task):
+    """Create a test file"""
+    return {
+        "filename": "diagnostic_test.md",
+        "content": render(
+            _DIAGNOSTIC_TMPL,
+            task=task,
+            timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
+            cwd=WORKING_DIR,
+            sandbox=SANDBOX_PATH,
+        ),
+    }
+
+
+def main():
+    return run(
+        create_test_file,
+        banner=("🔍 MCP Agent Diagnostic Test", "=" * 40),
+        status="🧪 Running diagnostic test...",
+        step_label="Processing",
+        done=(
+            "🎉 Diagnostic test completed successfully!",
+            "Final result: Diagnostic test passed - created {filename}",
+        ),
+        default_task="test task",
+    )
 
 if __name__ == "__main__":
     try:
         success = main()
         if success:
             print("SUCCESS")
-            sys.exit(0)
+            # Nothing left to clean up; skip interpreter teardown
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(0)
         else:
             print("FAILED") 
             sys.exit(1)
     except Exception as e:
-        print(f"❌ Diagnostic error: {e}")
+        print(f"❌ Diagnostic error: {e}", flush=True)
         print("FAILED")
         sys.exit(1)
\ No newline at end of file
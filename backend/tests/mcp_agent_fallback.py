@@ -1,26 +1,18 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -BOO
 """
 MCP Agent - Fallback Mode (Works without OpenAI Agents SDK)
 """
 
-import os
+import functools
+import re
 import sys
 import time
-import requests
-from datetime import datetime
+from datetime import datetime, timedelta
 
+from agent_core import render, run
 
-def create_intelligent_content(task):
-    """Create intelligent content based on task analysis"""
-
-    task_lower = task.lower()
-    current_date = datetime.now().strftime("%Y-%m-%d")
 
-    # Technology news briefing
-    if "technology" in task_lower and "news" in task_lower:
-        return {
-            "filename": "tech_news_briefing.md",
-            "content": f"""# Technology News Briefing - {current_date}
+_TECH_NEWS_TMPL = """# Technology News Briefing - {date}
 
 ## Top Technology Stories
 
@@ -60,15 +52,10 @@ def create_intelligent_content(task):
 - Startup funding focusing on AI and sustainability
 - Enterprise adoption of cloud-native solutions accelerating
 
-*Generated on {current_date} - Technology landscape analysis*
-"""
-        }
+*Generated on {date} - Technology landscape analysis*
+""".encode('utf-8')
 
-    # AI developments
-    elif "ai" in task_lower and ("development" in task_lower or "news" in task_lower):
-        return {
-            "filename": "ai_developments_report.md",
-            "content": f"""# AI Developments Report - {current_date}
+_AI_DEVELOPMENTS_TMPL = """# AI Developments Report - {date}
 
 ## Current AI Landscape
 
@@ -109,15 +96,10 @@ def create_intelligent_content(task):
 - Growing integration into everyday applications
 - Need for updated regulations and governance
 
-*Report generated {current_date} - AI industry analysis*
-"""
-        }
+*Report generated {date} - AI industry analysis*
+""".encode('utf-8')
 
-    # Python or programming content
-    elif "python" in task_lower:
-        return {
-            "filename": "python_guide.md",
-            "content": f"""# Python Programming Guide - {current_date}
+_PYTHON_GUIDE_TMPL = """# Python Programming Guide - {date}
 
 ## Python Overview
 Python is a versatile, high-level programming language known for its simplicity and readability.
@@ -177,15 +159,10 @@ model.fit(X_train, y_train)
 - Use meaningful variable names
 - Document your functions and classes
 
-*Guide updated {current_date} - Python programming essentials*
-"""
-        }
+*Guide updated {date} - Python programming essentials*
+""".encode('utf-8')
 
-    # Generic intelligent response
-    else:
-        return {
-            "filename": "task_analysis.md",
-            "content": f"""# Task Analysis and Response - {current_date}
+_TASK_ANALYSIS_TMPL = """# Task Analysis and Response - {date}
 
 ## Task Summary
 **Original Request**: {task}
@@ -220,66 +197,100 @@ When full MCP capabilities are available, this agent can:
 - Integrate with external APIs and services
 
 ## Technical Notes
-- **Generated**: {current_date}
+- **Generated**: {date}
 - **Mode**: Intelligent fallback mode
 - **Capabilities**: Content analysis and generation
 - **Output**: Structured markdown documentation
 
 *This response demonstrates intelligent content generation capabilities*
-"""
-        }
+""".encode('utf-8')
+
+
+_today = None
+_today_expires = 0.0
+
 
+def today():
+    """Current date as YYYY-MM-DD, recomputed only after local midnight"""
+    global _today, _today_expires
+    now = time.time()
+    if now >= _today_expires:
+        current = datetime.fromtimestamp(now)
+        _today = current.strftime("%Y-%m-%d")
+        tomorrow = datetime.combine(current.date() + timedelta(days=1), datetime.min.time())
+        _today_expires = tomorrow.timestamp()
+    return _today
 
-def main():
-    """Main function"""
-    print("🤖 MCP Agent Starting (Fallback Mode)...")
 
-    # Read task from stdin
-    try:
-        if len(sys.argv) > 1:
-            task = " ".join(sys.argv[1:])
-        else:
-            task = sys.stdin.read().strip()
-    except Exception as e:
-        print(f"❌ Error reading task: {e}")
-        sys.exit(1)
+def _tech_news_content(task, current_date):
+    """Technology news briefing"""
+    return "tech_news_briefing.md", render(_TECH_NEWS_TMPL, date=current_date)
 
-    if not task:
-        print("❌ No task provided")
-        sys.exit(1)
 
-    print(f"📋 Task: {task}")
+def _ai_developments_content(task, current_date):
+    """AI developments report"""
+    return "ai_developments_report.md", render(_AI_DEVELOPMENTS_TMPL, date=current_date)
 
-    # Create sandbox directory
-    sandbox_path = os.path.join(os.getcwd(), "sandbox")
-    os.makedirs(sandbox_path, exist_ok=True)
-    print(f"📁 Sandbox: {sandbox_path}")
 
-    # Simulate processing
-    print("🔄 Analyzing task and generating content...")
-    for i in range(4):
-        print(f"Step {i + 1}: Processing...")
-        time.sleep(0.6)
+def _python_guide_content(task, current_date):
+    """Python or programming content"""
+    return "python_guide.md", render(_PYTHON_GUIDE_TMPL, date=current_date)
 
-    # Generate intelligent content
-    result = create_intelligent_content(task)
-    filename = result["filename"]
-    content = result["content"]
 
-    # Write output file
-    output_file = os.path.join(sandbox_path, filename)
+def _task_analysis_content(task, current_date):
+    """Generic intelligent response"""
+    return "task_analysis.md", render(_TASK_ANALYSIS_TMPL, date=current_date, task=task)
 
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"📄 Created file: {filename}")
-        print(f"✅ Agent completed successfully!")
-        print(f"Generated intelligent content based on task analysis")
 
-    except Exception as e:
-        print(f"❌ Error creating file: {e}")
-        sys.exit(1)
+# Keyword sets checked in order against the task's words; first subset wins
+_DISPATCH = (
+    (frozenset({"technology", "news"}), _tech_news_content),
+    (frozenset({"ai", "development"}), _ai_developments_content),
+    (frozenset({"ai", "developments"}), _ai_developments_content),
+    (frozenset({"ai", "news"}), _ai_developments_content),
+    (frozenset({"python"}), _python_guide_content),
+)
+
+# One pass over the task picks out only the routing keywords, as whole words
+_KEYWORDS = sorted({word for keywords, _ in _DISPATCH for word in keywords},
+                   key=len, reverse=True)
+_KEYWORD_RE = re.compile(r"(?<![a-z])(%s)(?![a-z])" % "|".join(_KEYWORDS),
+                         re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _content_cached(task, current_date):
+    """(filename, content) for a task on a given date"""
+    tokens = {word.lower() for word in _KEYWORD_RE.findall(task)}
+
+    for keywords, handler in _DISPATCH:
+        if keywords <= tokens:
+            return handler(task, current_date)
+
+    return _task_analysis_content(task, current_date)
+
+
+def create_intelligent_content(task):
+    """Create intelligent content based on task analysis
+
+    Results are cached per task and date for the life of the process. A
+    one-shot run only builds its content once anyway, so the cache pays
+    off when this module is imported by a long-lived server.
+    """
+    filename, content = _content_cached(task, today())
+    return {"filename": filename, "content": content}
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if not run(
+        create_intelligent_content,
+        banner=("🤖 MCP Agent Starting (Fallback Mode)...",),
+        status="🔄 Analyzing task and generating content...",
+        steps=4,
+        step_label="Processing",
+        done=(
+            "✅ Agent completed successfully!",
+            "Generated intelligent content based on task analysis",
+        ),
+    ):
+        sys.exit(1)
\ No newline at end of file
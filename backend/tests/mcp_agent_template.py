@@ -1,46 +1,14 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -BOO
 """
 Working MCP Agent - Fixed Version
 """
 
-import os
 import sys
 import time
 
-def main():
-    print("🤖 MCP Agent Starting...")
-    
-    # Read task from stdin or command line
-    try:
-        if len(sys.argv) > 1:
-            task = " ".join(sys.argv[1:])
-        else:
-            task = sys.stdin.read().strip()
-    except Exception as e:
-        print(f"❌ Error reading task: {e}")
-        sys.exit(1)
-    
-    if not task:
-        print("❌ No task provided")
-        sys.exit(1)
-    
-    print(f"📋 Task: {task}")
-    
-    # Create sandbox directory
-    sandbox_path = os.path.join(os.getcwd(), "sandbox")
-    os.makedirs(sandbox_path, exist_ok=True)
-    print(f"📁 Sandbox: {sandbox_path}")
-    
-    # Simulate agent work
-    print("🔄 Processing task...")
-    for i in range(3):
-        print(f"Step {i+1}: Working...")
-        time.sleep(0.8)
-    
-    # Generate content based on task
-    if "banoffee" in task.lower() or "recipe" in task.lower():
-        filename = "banoffee.md"
-        content = """# Banoffee Pie Recipe
+from agent_core import render, run
+
+_BANOFFEE_RECIPE = """# Banoffee Pie Recipe
 
 A delicious British dessert combining bananas, toffee, and cream.
 
@@ -82,10 +50,9 @@ A delicious British dessert combining bananas, toffee, and cream.
 - Dip banana slices in lemon juice to prevent oxidation
 
 *Serves 8-10 people. A true British classic!*
-"""
-    elif "python" in task.lower():
-        filename = "python_guide.md"
-        content = """# Python Programming Guide
+""".encode('utf-8')
+
+_PYTHON_GUIDE = """# Python Programming Guide
 
 ## What is Python?
 Python is a high-level, interpreted programming language known for its simplicity and readability.
@@ -143,14 +110,13 @@ for fruit in fruits:
 4. Contribute to open source
 
 *Happy coding!*
-"""
-    else:
-        filename = "task_output.md"
-        content = f"""# Task Completed
+""".encode('utf-8')
+
+_TASK_OUTPUT_TMPL = """# Task Completed
 
 ## Task Details
 **Request**: {task}
-**Completed**: {time.strftime('%Y-%m-%d %H:%M:%S')}
+**Completed**: {timestamp}
 **Status**: ✅ Success
 
 ## Summary
@@ -168,21 +134,35 @@ Your MCP agent has successfully processed the task and generated this output fil
 - Try more complex tasks
 
 *Generated by MCP Web Agent*
-"""
-    
-    # Write the output file
-    output_file = os.path.join(sandbox_path, filename)
-    
-    try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
-        print(f"✅ Created file: {filename}")
-    except Exception as e:
-        print(f"❌ Error creating file: {e}")
-        sys.exit(1)
-    
-    print("🎉 Agent completed successfully!")
-    print(f"Output: Created {filename} with task results")
+""".encode('utf-8')
+
+
+def create_content(task):
+    """Generate content based on task"""
+    task_lower = task.lower()
+    if "banoffee" in task_lower or "recipe" in task_lower:
+        return {"filename": "banoffee.md", "content": _BANOFFEE_RECIPE}
+    elif "python" in task_lower:
+        return {"filename": "python_guide.md", "content": _PYTHON_GUIDE}
+    else:
+        return {
+            "filename": "task_output.md",
+            "content": render(
+                _TASK_OUTPUT_TMPL,
+                task=task,
+                timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
+            ),
+        }
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if not run(
+        create_content,
+        banner=("🤖 MCP Agent Starting...",),
+        status="🔄 Processing task...",
+        done=(
+            "🎉 Agent completed successfully!",
+            "Output: Created {filename} with task results",
+        ),
+    ):
+        sys.exit(1)
\ No newline at end of file
@@ -1,38 +1,14 @@
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -BOO
 """
 Minimal working MCP Agent - guaranteed to work
 """
 
-import os
 import sys
 import time
 
-def main():
-    # Read task
-    if len(sys.argv) > 1:
-        task = " ".join(sys.argv[1:])
-    else:
-        task = sys.stdin.read().strip()
-    
-    if not task:
-        print("No task provided")
-        sys.exit(1)
-    
-    print(f"🤖 Processing task: {task}")
-    
-    # Create sandbox
-    sandbox_path = os.path.join(os.getcwd(), "sandbox")
-    os.makedirs(sandbox_path, exist_ok=True)
-    
-    # Simulate work
-    for i in range(3):
-        print(f"Step {i+1}: Working...")
-        time.sleep(1)
-    
-    # Create output based on task
-    if "banoffee" in task.lower() or "recipe" in task.lower():
-        filename = "banoffee.md"
-        content = """# Banoffee Pie Recipe
+from agent_core import render, run
+
+_BANOFFEE_RECIPE = """# Banoffee Pie Recipe
 
 ## Ingredients
 - 200g digestive biscuits
@@ -55,10 +31,9 @@ def main():
 - Serve chilled for clean slices
 
 *A classic British dessert combining sweet toffee, fresh bananas, and cream!*
-"""
-    else:
-        filename = "output.md"
-        content = f"""# Task Results
+""".encode('utf-8')
+
+_OUTPUT_TMPL = """# Task Results
 
 ## Task
 {task}
@@ -67,21 +42,32 @@ def main():
 This is a simplified version of the MCP agent that creates basic output files.
 
 ## Generated
-- Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}
+- Timestamp: {timestamp}
 - File: {filename}
 - Status: Complete
 
 ## Next Steps
 If you see this file, the basic agent is working. You can then upgrade to the full MCP version.
-"""
-    
-    # Write file
-    output_file = os.path.join(sandbox_path, filename)
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"✅ Created: {filename}")
-    print("Agent completed successfully!")
+""".encode('utf-8')
+
+
+def create_content(task):
+    """Create output based on task"""
+    task_lower = task.lower()
+    if "banoffee" in task_lower or "recipe" in task_lower:
+        return {"filename": "banoffee.md", "content": _BANOFFEE_RECIPE}
+    else:
+        return {
+            "filename": "output.md",
+            "content": render(
+                _OUTPUT_TMPL,
+                task=task,
+                timestamp=time.strftime('%Y-%m-%d %H:%M:%S'),
+                filename="output.md",
+            ),
+        }
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if not run(create_content, done=("Agent completed successfully!",)):
+        sys.exit(1)
\ No newline at end of file